@@ -11,6 +11,12 @@ AMPLITUDE = 2.0
 Y_BASELINE = 9.8
 FREQUENCY = 1.25
 SLEEP_TIME = 0.1
+# Re-seed the sine recurrence from libm this often to keep rounding drift bounded
+RESYNC_INTERVAL = 1000
+
+# Byte template for the per-tick walking command; only the y component varies
+ACCEL_COMMAND_PREFIX = b"sensor set acceleration 0.00:"
+ACCEL_COMMAND_SUFFIX = b":0.00\n"
 
 
 def connect_to_emulator(host, port, auth_token):
@@ -45,23 +51,39 @@ def set_sensor_data(emulator, sensor, x, y, z):
     """
     try:
         command = f"sensor set {sensor} {x:.2f}:{y:.2f}:{z:.2f}\n"
-        emulator.write(command.encode())
-        emulator.read_until(b"OK", timeout=2)
+        emulator.write_pipelined(command.encode())
     except Exception as e:
         print(f"An error occurred while setting {sensor} data: {e}")
 
 
-def generate_walking_acceleration(step):
-    return 0.0, Y_BASELINE + AMPLITUDE * math.sin(FREQUENCY * step), 0.0
+def set_walking_acceleration(emulator, y):
+    """
+    Sends the walking accelerometer reading, which only ever varies on the y axis.
+    """
+    try:
+        emulator.write_pipelined(ACCEL_COMMAND_PREFIX + b"%.2f" % y + ACCEL_COMMAND_SUFFIX)
+    except Exception as e:
+        print(f"An error occurred while setting acceleration data: {e}")
 
 
 def run_simulation(emulator, bar_width=50, sine_width=60, sine_height=9):
     """
     Contains the main loop for sending sensor data to the emulator.
     """
+    # Replies are consumed in the background so each tick doesn't wait on an emulator round-trip
+    emulator.start_drain()
+
     step_counter = 0
-    previous_y = Y_BASELINE
-    was_rising = False
+    # Two-term recurrence sin(f*(n+1)) = 2*cos(f)*sin(f*n) - sin(f*(n-1)): one multiply and
+    # one subtract per tick instead of a libm sin() call
+    sine_coeff = 2 * math.cos(FREQUENCY)
+    sine_prev = math.sin(-FREQUENCY)
+    sine_curr = 0.0
+    # The same recurrence tracks slope(n) = cos(f*(n - 1/2)). Since
+    # sin(f*n) - sin(f*(n-1)) = 2*sin(f/2)*cos(f*(n - 1/2)), its sign says whether the
+    # wave rose into tick n, so peaks are found without comparing successive y values.
+    slope_prev = math.cos(-1.5 * FREQUENCY)
+    slope_curr = math.cos(-0.5 * FREQUENCY)
 
     dual_graph = DualGraph(
         bar_width=bar_width,
@@ -77,27 +99,40 @@ def run_simulation(emulator, bar_width=50, sine_width=60, sine_height=9):
     print("-" * max(bar_width + 20, sine_width + 20))  # Dynamic width
     print()  # Extra space for the graph area
 
+    # Deadline scheduling keeps the tick cadence fixed regardless of render and telnet time;
+    # when a tick overruns, the schedule restarts from now instead of bursting to catch up
+    next_deadline = time.monotonic() + SLEEP_TIME
+
     try:
         while True:
-            # Generate accelerometer data using integer step counter (for consistent step detection)
-            x, y, z = generate_walking_acceleration(step_counter)
-            set_sensor_data(emulator, "acceleration", x, y, z)
+            if step_counter and step_counter % RESYNC_INTERVAL == 0:
+                sine_prev = math.sin(FREQUENCY * (step_counter - 1))
+                sine_curr = math.sin(FREQUENCY * step_counter)
+                slope_prev = math.cos(FREQUENCY * (step_counter - 1.5))
+                slope_curr = math.cos(FREQUENCY * (step_counter - 0.5))
 
-            # Calculate sine value for visualization that exactly matches accelerometer data
-            # Both use the same sine calculation to ensure perfect synchronization
-            sine_value = math.sin(FREQUENCY * step_counter)
+            # The accelerometer data and the visualization share one sine value so they stay
+            # perfectly synchronized
+            sine_value = sine_curr
+            y = Y_BASELINE + AMPLITUDE * sine_value
+            set_walking_acceleration(emulator, y)
 
-            # Step detection logic (uses integer-based y values for accuracy)
-            is_rising_now = y > previous_y
-            step_detected = was_rising and not is_rising_now
+            # A step lands on the tick after a peak: rising into the previous tick, not this one
+            step_detected = slope_prev > 0.0 and slope_curr <= 0.0
 
             # Plot with step impact notification in correct position
             dual_graph.plot(y, sine_value, step_impact=step_detected)
 
-            was_rising = is_rising_now
-            previous_y = y
+            sine_prev, sine_curr = sine_curr, sine_coeff * sine_curr - sine_prev
+            slope_prev, slope_curr = slope_curr, sine_coeff * slope_curr - slope_prev
             step_counter += 1
-            time.sleep(SLEEP_TIME)
+
+            now = time.monotonic()
+            if now < next_deadline:
+                time.sleep(next_deadline - now)
+                next_deadline += SLEEP_TIME
+            else:
+                next_deadline = now + SLEEP_TIME
     except KeyboardInterrupt:
         print("\n\nStopping simulation.")
     finally:
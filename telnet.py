@@ -1,20 +1,116 @@
+import select
 import socket
+import threading
+import time
+
+READ_BUFFER_SIZE = 8192
+# Replies the emulator console sends once per command
+REPLY_PREFIXES = (b"OK", b"KO")
 
 
 class TelnetConnection:
     def __init__(self, host, port, timeout=10):
         self.sock = socket.create_connection((host, port), timeout=timeout)
         self.sock.settimeout(timeout)
+        # Commands are tiny and latency-sensitive; don't let Nagle hold them back
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        # Receive buffer reused across reads; bytes past a delimiter stay here for the next call
+        self._buf = bytearray(READ_BUFFER_SIZE)
+        self._buffered = 0
+        # Pipelined writes: a drain thread consumes replies and tracks how many are pending
+        self._replies = threading.Condition()
+        self._outstanding = 0
+        self._max_outstanding = 0
+        self._drain_thread = None
+
+    def start_drain(self, max_outstanding=8):
+        # Once started, replies belong to the drain thread; don't call read_until concurrently
+        self._max_outstanding = max_outstanding
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
+
+    def _drain(self):
+        try:
+            while True:
+                line = self.read_until(b"\n", timeout=None)
+                if line.startswith(REPLY_PREFIXES):
+                    with self._replies:
+                        self._outstanding -= 1
+                        self._replies.notify_all()
+        except OSError:
+            pass  # Connection closed
+        finally:
+            with self._replies:
+                self._drain_thread = None
+                self._replies.notify_all()
 
     def read_until(self, expected, timeout=10):
-        self.sock.settimeout(timeout)
-        data = b""
-        while expected not in data:
-            data += self.sock.recv(4096)
-        return data
+        # The timeout bounds the whole read, not each recv; None waits indefinitely
+        deadline = None if timeout is None else time.monotonic() + timeout
+        buf = self._buf
+        view = memoryview(buf)
+        n = self._buffered
+        search_start = 0
+        try:
+            while True:
+                idx = buf.find(expected, search_start, n)
+                if idx != -1:
+                    end = idx + len(expected)
+                    data = bytes(view[:end])
+                    view[: n - end] = view[end:n]
+                    self._buffered = n - end
+                    return data
+
+                # Only the new tail (plus a possible split delimiter) needs searching next time
+                search_start = max(0, n - len(expected) + 1)
+                if n == len(buf):
+                    view.release()
+                    buf.extend(bytes(len(buf)))
+                    view = memoryview(buf)
+
+                # Wait for readiness so the recv below returns whatever has arrived immediately
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                ready, _, _ = select.select([self.sock], [], [], remaining)
+                if not ready:
+                    raise TimeoutError(f"timed out waiting for {expected!r}")
+                received = self.sock.recv_into(view[n:])
+                if not received:
+                    # A readable socket returning no data has been closed by the peer
+                    raise ConnectionResetError("connection closed by the emulator")
+                n += received
+                self._buffered = n
+        finally:
+            view.release()
 
     def write(self, data):
         self.sock.sendall(data)
 
-    def close(self):
+    def write_pipelined(self, data, timeout=2):
+        # Send without waiting for the reply; only block once too many replies are pending
+        if self._drain_thread is None:
+            self.write(data)
+            self.read_until(b"OK", timeout=timeout)
+            return
+        with self._replies:
+            if not self._replies.wait_for(
+                lambda: self._outstanding < self._max_outstanding, timeout
+            ):
+                raise TimeoutError("emulator stopped acknowledging commands")
+            self._outstanding += 1
+        self.sock.sendall(data)
+
+    def close(self, timeout=2):
+        drain_thread = self._drain_thread
+        if drain_thread is not None:
+            # Let pending commands be acknowledged before tearing the connection down
+            with self._replies:
+                self._replies.wait_for(
+                    lambda: self._outstanding <= 0 or self._drain_thread is None, timeout
+                )
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            drain_thread.join(timeout)
         self.sock.close()
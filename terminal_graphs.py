@@ -3,20 +3,50 @@ Terminal-based graphing package for real-time data visualization.
 Provides bar graphs and smooth sine wave displays using ASCII characters.
 """
 
+import sys
+from collections import deque
+
+
+def _cursor_forward(columns):
+    """ANSI sequence moving the cursor right by ``columns`` (a zero count would still move one)."""
+    return f"\033[{columns}C" if columns else ""
+
 
 class ShoeAnimation:
     """
     Handles ASCII shoe animation that progresses through walking states based on sine wave position.
     """
 
+    __slots__ = ("shoe_states", "landing_message", "_state_table")
+
     def __init__(self):
+        # Pre-encoded so frames can be written without re-encoding the fixed glyphs
         self.shoe_states = {
-            "ready": "👟 Step: [▬▬▬] Ready",
-            "lifting": "👟 Step: [▬▬▬] Lifting...",
-            "striding": "👟 Step: [▬▬▬] ↗ Striding",
-            "landing": "👟 Step: [▬▬▬] ↘ Landing!",
+            "ready": "👟 Step: [▬▬▬] Ready".encode(),
+            "lifting": "👟 Step: [▬▬▬] Lifting...".encode(),
+            "striding": "👟 Step: [▬▬▬] ↗ Striding".encode(),
+            "landing": "👟 Step: [▬▬▬] ↘ Landing!".encode(),
+        }
+        self.landing_message = "🦶 STEP LANDED! 🦶".encode()
+
+        # State for each (sine bucket, step detected) pair; the bucket counts how many of the
+        # thresholds -0.3, 0.3 and 0.5 the sine value has reached. Every lookup returns one of
+        # these same objects, so callers can compare against the previous state with `is`.
+        states = self.shoe_states
+        self._state_table = {
+            # Ready state - foot flat on ground, between steps
+            (0, False): states["ready"],
+            (0, True): states["ready"],
+            # Lifting state - foot lifting off ground
+            (1, False): states["lifting"],
+            (1, True): states["lifting"],
+            # Striding state - foot in air, approaching peak
+            (2, False): states["striding"],
+            (2, True): states["striding"],
+            (3, False): states["striding"],
+            # Landing state - triggered at sine wave peaks (step detection)
+            (3, True): states["landing"],
         }
-        self.landing_message = "🦶 STEP LANDED! 🦶"
 
     def get_shoe_state(self, sine_value, step_detected):
         """
@@ -27,20 +57,10 @@ class ShoeAnimation:
             step_detected: Boolean indicating if a step peak was detected
 
         Returns:
-            String with the appropriate shoe animation for current walking phase
+            UTF-8 bytes with the appropriate shoe animation for current walking phase
         """
-        if step_detected and sine_value >= 0.5:
-            # Landing state - triggered at sine wave peaks (step detection)
-            return self.shoe_states["landing"]
-        elif sine_value >= 0.3:
-            # Striding state - foot in air, approaching peak
-            return self.shoe_states["striding"]
-        elif sine_value >= -0.3:
-            # Lifting state - foot lifting off ground
-            return self.shoe_states["lifting"]
-        else:
-            # Ready state - foot flat on ground, between steps
-            return self.shoe_states["ready"]
+        bucket = (sine_value >= 0.5) + (sine_value >= 0.3) + (sine_value >= -0.3)
+        return self._state_table[bucket, bool(step_detected)]
 
     def get_landing_line(self, step_detected):
         """
@@ -50,9 +70,9 @@ class ShoeAnimation:
             step_detected: Boolean indicating if a step peak was detected
 
         Returns:
-            String with landing message if step detected, empty string otherwise
+            UTF-8 bytes with landing message if step detected, empty bytes otherwise
         """
-        return self.landing_message if step_detected else ""
+        return self.landing_message if step_detected else b""
 
 
 class DataBuffer:
@@ -60,29 +80,28 @@ class DataBuffer:
     Circular buffer to store recent data points for visualization.
     """
 
-    def __init__(self, size=60):
+    __slots__ = ("size", "buffer", "has_data")
+
+    def __init__(self, size=60, initial_value=0.0):
         self.size = size
-        self.buffer = [0.0] * size
-        self.index = 0
+        # Bounded deque: appending drops the oldest value and iteration is oldest to newest
+        self.buffer = deque([initial_value] * size, maxlen=size)
         self.has_data = False
 
     def add_value(self, value):
         """Add a new value to the buffer."""
-        self.buffer[self.index] = value
-        self.index = (self.index + 1) % self.size
+        self.buffer.append(value)
         self.has_data = True
 
     def get_display_values(self):
-        """Get values in display order (oldest to newest)."""
-        return self.buffer[self.index :] + self.buffer[: self.index]
+        """Get values in display order (oldest to newest) without copying them."""
+        return self.buffer
 
     def get_current_value(self):
         """Get the most recently added value."""
         if not self.has_data:
             return None
-        # The current value is at the previous index (since we increment after storing)
-        current_index = (self.index - 1) % self.size
-        return self.buffer[current_index]
+        return self.buffer[-1]
 
 
 class BarGraph:
@@ -90,24 +109,29 @@ class BarGraph:
     Horizontal bar graph for displaying single values.
     """
 
+    __slots__ = ("width", "min_val", "max_val", "label", "_scale", "_label_prefix", "_full_bar")
+
     def __init__(self, width=50, value_range=(0, 10), label="Value"):
         self.width = width
         self.min_val, self.max_val = value_range
         self.label = label
 
+        # Precomputed so plotting is a single multiply per value
+        self._scale = width / (self.max_val - self.min_val)
+        self._label_prefix = f"{label}: "
+        # Bars of any length are slices of this, so drawing one doesn't build a new string
+        self._full_bar = "#" * width
+
     def plot(self, value):
         """Plot a single value as a horizontal bar."""
         # Clamp value to range
         clamped_value = max(self.min_val, min(value, self.max_val))
 
-        # Normalize to 0-1 range
-        normalized = (clamped_value - self.min_val) / (self.max_val - self.min_val)
-
         # Create bar
-        bar_length = int(normalized * self.width)
-        bar = "#" * bar_length
+        bar_length = int((clamped_value - self.min_val) * self._scale)
+        bar = self._full_bar[:bar_length]
 
-        print(f"{self.label}: {value:5.2f} | {bar}")
+        print(f"{self._label_prefix}{value:5.2f} | {bar}")
 
 
 class SineWaveGraph:
@@ -115,6 +139,21 @@ class SineWaveGraph:
     Animated sine wave visualization showing temporal progression with trail effect.
     """
 
+    __slots__ = (
+        "width",
+        "height",
+        "min_val",
+        "max_val",
+        "buffer",
+        "row_labels",
+        "_row_scale",
+        "_label_len",
+        "_blank_rows",
+        "_age_chars",
+        "_column_chars",
+        "_row_buffer",
+    )
+
     def __init__(self, width=60, height=9, value_range=(-1, 1)):
         self.width = width
         self.height = height
@@ -131,16 +170,44 @@ class SineWaveGraph:
             else:
                 self.row_labels.append(f"{row_value:5.2f}|")
 
+        # Pad labels to a common width so every row has the same stride and a column's
+        # position is the same in every row
+        self._label_len = max(len(label) for label in self.row_labels)
+        self.row_labels = [label.rjust(self._label_len) for label in self.row_labels]
+
+        # Precomputed so row mapping is a single multiply per value
+        self._row_scale = (height - 1) / (self.max_val - self.min_val)
+
+        # Blank rows as lists of single-character cells, copied per frame so plotting a point
+        # is an O(1) cell assignment rather than a rebuild of the whole row string
+        self._blank_rows = [list(label + " " * width) for label in self.row_labels]
+
+        # Trail glyph indexed by point age (0 = newest)
+        self._age_chars = tuple((["●"] + ["•"] * 4 + ["·"] * 10 + ["."] * (width - 15))[:width])
+        # The same glyphs in column order (oldest first), matching the buffer's iteration order
+        self._column_chars = self._age_chars[::-1]
+
+        # Row index of every buffered value, kept in step with the value buffer. The display
+        # only scrolls, so each frame maps just the newest value instead of the whole buffer.
+        # Values are clamped when mapped, so every cached index is a valid row.
+        self._row_buffer = DataBuffer(width, initial_value=self._value_to_row_index(0.0))
+
+    def add_value(self, value):
+        """Add a new value to the buffer along with its row index."""
+        self.buffer.add_value(value)
+        self._row_buffer.add_value(self._value_to_row_index(value))
+
     def _value_to_row(self, value):
         """Convert a value to its corresponding row position (0 = top, height-1 = bottom)."""
         # Clamp value to range
         clamped = max(self.min_val, min(value, self.max_val))
 
-        # Normalize to 0-1 range, then scale to row range
-        normalized = (clamped - self.min_val) / (self.max_val - self.min_val)
-        row = (1 - normalized) * (self.height - 1)  # Invert because row 0 is top
+        # Scale distance from the top of the range to row range (row 0 is top)
+        return (self.max_val - clamped) * self._row_scale
 
-        return row
+    def _value_to_row_index(self, value):
+        """Convert a value to the index of the row it is drawn on."""
+        return int(round(self._value_to_row(value)))
 
 
 class DualGraph:
@@ -148,6 +215,21 @@ class DualGraph:
     Combines bar graph and sine wave for dual visualization with in-place updates.
     """
 
+    __slots__ = (
+        "bar_graph",
+        "sine_graph",
+        "shoe_animation",
+        "first_render",
+        "total_lines",
+        "_last_bar_prefix",
+        "_last_bar_len",
+        "_last_shoe",
+        "_last_landing",
+        "_last_sine_rows",
+        "_frame_buf",
+        "_cursor_up",
+    )
+
     def __init__(
         self,
         bar_width=50,
@@ -164,87 +246,149 @@ class DualGraph:
             4 + sine_height
         )  # 1 bar + 1 shoe animation + 1 landing line + 1 spacing + sine_height lines
 
+        # What each line showed last frame, so unchanged lines (and idle frames) can be skipped
+        self._last_bar_prefix = None
+        self._last_bar_len = None
+        self._last_shoe = None
+        self._last_landing = None
+        self._last_sine_rows = [None] * sine_height
+
+        # Reusable output buffer for one frame and the fixed cursor-up sequence that starts it
+        self._frame_buf = bytearray()
+        self._cursor_up = f"\033[{self.total_lines}A".encode()
+
     def plot(self, accel_value, sine_value, step_impact=False):
         """Plot both the accelerometer bar and sine wave point with in-place updates."""
+        bar_graph = self.bar_graph
+        shoe_animation = self.shoe_animation
+        first_render = self.first_render
+
         # Add sine wave data point
-        self.sine_graph.buffer.add_value(sine_value)
+        self.sine_graph.add_value(sine_value)
+
+        # The whole frame is assembled here and written with a single call, but only if some
+        # line actually changed
+        buf = self._frame_buf
+        dirty = False
 
         # If not first render, move cursor up to overwrite previous output
-        if not self.first_render:
-            print(f"\033[{self.total_lines}A", end="")
+        if not first_render:
+            buf += self._cursor_up
 
         # Render bar graph
-        print("\033[2K", end="")  # Clear line
-        clamped_value = max(self.bar_graph.min_val, min(accel_value, self.bar_graph.max_val))
-        normalized = (clamped_value - self.bar_graph.min_val) / (
-            self.bar_graph.max_val - self.bar_graph.min_val
-        )
-        bar_length = int(normalized * self.bar_graph.width)
-        bar = "#" * bar_length
-        print(f"Accel: {accel_value:5.2f} | {bar}")
+        min_val = bar_graph.min_val
+        clamped_value = max(min_val, min(accel_value, bar_graph.max_val))
+        bar_length = int((clamped_value - min_val) * bar_graph._scale)
+        prefix = f"{bar_graph._label_prefix}{accel_value:5.2f} | "
+        full_bar = bar_graph._full_bar
+        last_prefix = self._last_bar_prefix
+        last_bar_len = self._last_bar_len
+        if last_prefix is None or len(prefix) != len(last_prefix):
+            # Clear line and redraw it in full
+            line = "\033[2K" + prefix + full_bar[:bar_length]
+        elif bar_length > last_bar_len:
+            # Overwrite the value, then extend the bar past its old end
+            line = prefix + _cursor_forward(last_bar_len) + full_bar[last_bar_len:bar_length]
+        elif bar_length < last_bar_len:
+            # Overwrite the value, then erase the bar beyond its new end
+            line = prefix + _cursor_forward(bar_length) + "\033[K"
+        elif prefix != last_prefix:
+            line = prefix
+        else:
+            line = None
+        if line is None:
+            buf += b"\033[1B"  # Unchanged, move to next line
+        else:
+            buf += line.encode()
+            buf.append(0x0A)
+            self._last_bar_prefix = prefix
+            self._last_bar_len = bar_length
+            dirty = True
 
         # Render shoe animation (after bar, before wave)
-        print("\033[2K", end="")  # Clear line
-        shoe_state = self.shoe_animation.get_shoe_state(sine_value, step_impact)
-        print(shoe_state)
+        shoe_state = shoe_animation.get_shoe_state(sine_value, step_impact)
+        if shoe_state is self._last_shoe:
+            buf += b"\033[1B"  # Unchanged, move to next line
+        else:
+            buf += b"\033[2K"  # Clear line
+            buf += shoe_state
+            buf.append(0x0A)
+            self._last_shoe = shoe_state
+            dirty = True
 
         # Render landing line (only shows when step lands)
-        print("\033[2K", end="")  # Clear line
-        landing_line = self.shoe_animation.get_landing_line(step_impact)
-        print(landing_line)
+        landing_line = shoe_animation.get_landing_line(step_impact)
+        if landing_line is self._last_landing:
+            buf += b"\033[1B"  # Unchanged, move to next line
+        else:
+            buf += b"\033[2K"  # Clear line
+            buf += landing_line
+            buf.append(0x0A)
+            self._last_landing = landing_line
+            dirty = True
 
         # Spacing line
-        print("\033[2K")  # Clear line and move to next
+        if first_render:
+            buf += b"\033[2K\n"  # Clear line and move to next
+        else:
+            buf += b"\033[1B"  # Already blank, move to next line
 
         # Render sine wave
-        self._render_sine_wave()
+        if self._render_sine_wave(buf):
+            dirty = True
+
+        # On an idle frame the screen already shows exactly this, so nothing is written and the
+        # cursor stays where the last written frame left it
+        if dirty:
+            # Flush any text printed since the last frame first so output stays in order
+            sys.stdout.flush()
+            sys.stdout.buffer.write(buf)
+            sys.stdout.buffer.flush()
+        buf.clear()
 
         self.first_render = False
 
-    def _render_sine_wave(self):
-        """Render the sine wave graph."""
-        # Get buffered values
-        values = self.sine_graph.buffer.get_display_values()
+    def _render_sine_wave(self, buf):
+        """Render the sine wave graph into the frame buffer, returning whether any row changed."""
+        sine_graph = self.sine_graph
+
+        # Get the cached row index of each buffered value
+        row_indices = sine_graph._row_buffer.get_display_values()
 
         # Initialize rows with labels
-        rows = [label + " " * self.sine_graph.width for label in self.sine_graph.row_labels]
+        rows = [blank[:] for blank in sine_graph._blank_rows]
 
         # Plot points with trail effect
         # Only plot if we have actual data in the buffer
-        if self.sine_graph.buffer.has_data:
-            for i, value in enumerate(values):
-                target_row = self.sine_graph._value_to_row(value)
-                row_idx = int(round(target_row))
-
-                if 0 <= row_idx < self.sine_graph.height:
-                    age = len(values) - i - 1
-                    if age == 0:
-                        char = "●"
-                    elif age < 5:
-                        char = "•"
-                    elif age < 15:
-                        char = "·"
-                    else:
-                        char = "."
-
-                    # Replace character at position
-                    pos = len(self.sine_graph.row_labels[0]) + i
-                    if pos < len(rows[row_idx]):
-                        row_list = list(rows[row_idx])
-                        row_list[pos] = char
-                        rows[row_idx] = "".join(row_list)
+        if sine_graph.buffer.has_data:
+            column_chars = sine_graph._column_chars
+            # Columns start right after the row label, so count positions from its length
+            for pos, (row_idx, char) in enumerate(
+                zip(row_indices, column_chars), sine_graph._label_len
+            ):
+                # Replace character at position
+                rows[row_idx][pos] = char
 
         # Add current value indicator
-        current_value = self.sine_graph.buffer.get_current_value()
+        current_value = sine_graph.buffer.get_current_value()
         if current_value is not None:
-            current_row = int(round(self.sine_graph._value_to_row(current_value)))
-            if 0 <= current_row < self.sine_graph.height:
-                rows[current_row] += f" ← Current: {current_value:+.2f}"
-
-        # Print all rows
-        for row in rows:
-            print("\033[2K", end="")  # Clear line
-            print(row)
+            current_row = sine_graph._row_buffer.get_current_value()
+            rows[current_row].append(f" ← Current: {current_value:+.2f}")
+
+        # Add all rows that differ from the last frame
+        last_rows = self._last_sine_rows
+        changed = False
+        for i, row in enumerate(rows):
+            line = "".join(row).encode()
+            if line == last_rows[i]:
+                buf += b"\033[1B"  # Unchanged, move to next line
+            else:
+                buf += b"\033[2K"  # Clear line
+                buf += line
+                buf.append(0x0A)
+                last_rows[i] = line
+                changed = True
+        return changed
 
 
 # This module provides terminal graphing functionality as an API